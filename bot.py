@@ -1,10 +1,15 @@
 import asyncio
+import atexit
+import heapq
 import json
 import os
-from dataclasses import dataclass
-from datetime import datetime, date
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterable, List, Optional
 
 import discord
 from discord import app_commands
@@ -13,11 +18,48 @@ SCHEDULES_PATH = Path("schedules.json")
 TASKS_PATH = Path("tasks.json")
 CONFIG_PATH = Path("config.json")
 GLOSSARY_PATH = Path("glossary.json")
-CHECK_INTERVAL_SECONDS = 30
-HOURLY_CHECK_SECONDS = 30
+CHANNEL_NEGATIVE_TTL_SECONDS = 300
+EMBED_MAX_FIELDS = 25  # Discord's hard per-embed field limit
+CHECKPOINT_INTERVAL_SECONDS = 600
 
+try:
+    # Optional: Rust-backed JSON is several times faster on both paths and
+    # works on bytes directly, skipping the intermediate str.
+    import orjson
 
-@dataclass
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _atomic_write_json(path: Path, obj) -> None:
+    # Write to a sibling tempfile and rename so a crash never leaves a
+    # truncated store behind; compact separators keep the files small.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_dumps(obj))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _item_dict(item, field_names: tuple) -> dict:
+    # Slotted dataclasses have no __dict__; this is also faster than
+    # dataclasses.asdict, which recurses.
+    return {name: getattr(item, name) for name in field_names}
+
+
+@dataclass(slots=True)
 class ScheduleItem:
     id: int
     guild_id: int
@@ -27,28 +69,130 @@ class ScheduleItem:
     last_run_date: Optional[str] = None  # ISO date string
 
 
+_SCHEDULE_FIELDS = tuple(f.name for f in fields(ScheduleItem))
+
+
 class ScheduleStore:
     def __init__(self, path: Path) -> None:
         self.path = path
+        self.log_path = path.with_suffix(".log")
         self._items: List[ScheduleItem] = []
+        self._by_id: Dict[int, ScheduleItem] = {}
+        self._by_time: Dict[str, List[ScheduleItem]] = {}
+        self._by_guild: Dict[int, List[ScheduleItem]] = {}
         self._next_id = 1
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._log_file: Optional[BinaryIO] = None  # opened lazily on first append
+        self._log_size = 0
+        self._snapshot_size = 0
         self.load()
 
     def load(self) -> None:
-        if not self.path.exists():
+        if self.path.exists():
+            raw = self.path.read_bytes()
+            data = _loads(raw)
+            self._items = [ScheduleItem(**item) for item in data.get("items", [])]
+            self._next_id = data.get("next_id", 1)
+            self._snapshot_size = len(raw)
+        else:
             self._items = []
             self._next_id = 1
-            return
-        data = json.loads(self.path.read_text())
-        self._items = [ScheduleItem(**item) for item in data.get("items", [])]
-        self._next_id = data.get("next_id", 1)
+            self._snapshot_size = 0
+        replayed = self._replay_log()
+        self._rebuild_index()
+        if replayed:
+            # Fold the journal into a fresh snapshot on startup.
+            self._dirty = True
+            self.save()
+
+    def _replay_log(self) -> int:
+        if not self.log_path.exists():
+            return 0
+        count = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    # Torn tail write; drop the partial record.
+                    break
+                op = record.get("op")
+                if op == "add":
+                    item = ScheduleItem(**record["item"])
+                    self._items.append(item)
+                    self._next_id = max(self._next_id, item.id + 1)
+                elif op == "remove":
+                    record_id = record.get("id")
+                    self._items = [item for item in self._items if item.id != record_id]
+                elif op == "last_run":
+                    record_id = record.get("id")
+                    for item in self._items:
+                        if item.id == record_id:
+                            item.last_run_date = record.get("date")
+                            break
+                count += 1
+        return count
+
+    def _append_log(self, record: dict) -> None:
+        if self._log_file is None:
+            self._log_file = open(self.log_path, "ab")
+        line = _dumps(record)
+        self._log_file.write(line + b"\n")
+        self._log_file.flush()
+        self._log_size += len(line) + 1
+        self._mark_dirty()
+        if self._log_size > max(self._snapshot_size, 1024):
+            # The journal has outgrown the snapshot; compact.
+            self.save()
+
+    def _truncate_log(self) -> None:
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        try:
+            os.remove(self.log_path)
+        except FileNotFoundError:
+            pass
+        self._log_size = 0
+
+    def _rebuild_index(self) -> None:
+        self._by_id = {item.id: item for item in self._items}
+        self._by_time = {}
+        self._by_guild = {}
+        for item in self._items:
+            self._by_time.setdefault(item.time, []).append(item)
+            self._by_guild.setdefault(item.guild_id, []).append(item)
 
     def save(self) -> None:
         data = {
             "next_id": self._next_id,
-            "items": [item.__dict__ for item in self._items],
+            "items": [_item_dict(item, _SCHEDULE_FIELDS) for item in self._items],
         }
-        self.path.write_text(json.dumps(data, indent=2))
+        _atomic_write_json(self.path, data)
+        self._truncate_log()
+        self._snapshot_size = self.path.stat().st_size
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+
+    def flush(self) -> None:
+        if self._dirty:
+            self.save()
+
+    async def flush_if_due(self, min_interval: float = 5.0) -> None:
+        if self._dirty and time.monotonic() - self._last_flush > min_interval:
+            self.save()
+
+    @contextmanager
+    def grouped_writes(self):
+        # Batch multi-step mutations into a single write on exit.
+        try:
+            yield self
+        finally:
+            self.flush()
 
     def add(self, guild_id: int, channel_id: int, time: str, message: str) -> ScheduleItem:
         item = ScheduleItem(
@@ -61,32 +205,40 @@ class ScheduleStore:
         )
         self._next_id += 1
         self._items.append(item)
-        self.save()
+        self._by_id[item.id] = item
+        self._by_time.setdefault(item.time, []).append(item)
+        self._by_guild.setdefault(item.guild_id, []).append(item)
+        self._append_log({"op": "add", "item": _item_dict(item, _SCHEDULE_FIELDS)})
         return item
 
     def remove(self, schedule_id: int) -> bool:
-        before = len(self._items)
-        self._items = [item for item in self._items if item.id != schedule_id]
-        if len(self._items) == before:
+        item = self._by_id.pop(schedule_id, None)
+        if item is None:
             return False
-        self.save()
+        self._items.remove(item)
+        self._by_time[item.time].remove(item)
+        self._by_guild[item.guild_id].remove(item)
+        self._append_log({"op": "remove", "id": schedule_id})
         return True
 
     def list_for_guild(self, guild_id: int) -> List[ScheduleItem]:
-        return [item for item in self._items if item.guild_id == guild_id]
+        return self._by_guild.get(guild_id, [])
 
     def all(self) -> List[ScheduleItem]:
         return list(self._items)
 
+    def due_at(self, hhmm: str) -> List[ScheduleItem]:
+        return self._by_time.get(hhmm, [])
+
     def update_last_run(self, schedule_id: int, run_date: date) -> None:
-        for item in self._items:
-            if item.id == schedule_id:
-                item.last_run_date = run_date.isoformat()
-                break
-        self.save()
+        item = self._by_id.get(schedule_id)
+        if item is None:
+            return
+        item.last_run_date = run_date.isoformat()
+        self._append_log({"op": "last_run", "id": schedule_id, "date": item.last_run_date})
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskItem:
     id: int
     guild_id: int
@@ -96,28 +248,121 @@ class TaskItem:
     created_at: str = ""
 
 
+_TASK_FIELDS = tuple(f.name for f in fields(TaskItem))
+
+
 class TaskStore:
     def __init__(self, path: Path) -> None:
         self.path = path
+        self.log_path = path.with_suffix(".log")
         self._items: List[TaskItem] = []
+        self._by_id: Dict[int, TaskItem] = {}
+        self._by_guild: Dict[int, List[TaskItem]] = {}
         self._next_id = 1
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._log_file: Optional[BinaryIO] = None  # opened lazily on first append
+        self._log_size = 0
+        self._snapshot_size = 0
         self.load()
 
     def load(self) -> None:
-        if not self.path.exists():
+        if self.path.exists():
+            raw = self.path.read_bytes()
+            data = _loads(raw)
+            self._items = [TaskItem(**item) for item in data.get("items", [])]
+            self._next_id = data.get("next_id", 1)
+            self._snapshot_size = len(raw)
+        else:
             self._items = []
             self._next_id = 1
-            return
-        data = json.loads(self.path.read_text())
-        self._items = [TaskItem(**item) for item in data.get("items", [])]
-        self._next_id = data.get("next_id", 1)
+            self._snapshot_size = 0
+        replayed = self._replay_log()
+        self._rebuild_index()
+        if replayed:
+            # Fold the journal into a fresh snapshot on startup.
+            self._dirty = True
+            self.save()
+
+    def _replay_log(self) -> int:
+        if not self.log_path.exists():
+            return 0
+        count = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    # Torn tail write; drop the partial record.
+                    break
+                op = record.get("op")
+                if op == "add":
+                    item = TaskItem(**record["item"])
+                    self._items.append(item)
+                    self._next_id = max(self._next_id, item.id + 1)
+                elif op == "remove":
+                    record_id = record.get("id")
+                    self._items = [item for item in self._items if item.id != record_id]
+                count += 1
+        return count
+
+    def _append_log(self, record: dict) -> None:
+        if self._log_file is None:
+            self._log_file = open(self.log_path, "ab")
+        line = _dumps(record)
+        self._log_file.write(line + b"\n")
+        self._log_file.flush()
+        self._log_size += len(line) + 1
+        self._mark_dirty()
+        if self._log_size > max(self._snapshot_size, 1024):
+            # The journal has outgrown the snapshot; compact.
+            self.save()
+
+    def _truncate_log(self) -> None:
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        try:
+            os.remove(self.log_path)
+        except FileNotFoundError:
+            pass
+        self._log_size = 0
+
+    def _rebuild_index(self) -> None:
+        self._by_id = {item.id: item for item in self._items}
+        self._by_guild = {}
+        for item in self._items:
+            self._by_guild.setdefault(item.guild_id, []).append(item)
 
     def save(self) -> None:
         data = {
             "next_id": self._next_id,
-            "items": [item.__dict__ for item in self._items],
+            "items": [_item_dict(item, _TASK_FIELDS) for item in self._items],
         }
-        self.path.write_text(json.dumps(data, indent=2))
+        _atomic_write_json(self.path, data)
+        self._truncate_log()
+        self._snapshot_size = self.path.stat().st_size
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+
+    def flush(self) -> None:
+        if self._dirty:
+            self.save()
+
+    async def flush_if_due(self, min_interval: float = 5.0) -> None:
+        if self._dirty and time.monotonic() - self._last_flush > min_interval:
+            self.save()
+
+    @contextmanager
+    def grouped_writes(self):
+        # Batch multi-step mutations into a single write on exit.
+        try:
+            yield self
+        finally:
+            self.flush()
 
     def add(
         self,
@@ -136,19 +381,29 @@ class TaskStore:
         )
         self._next_id += 1
         self._items.append(item)
-        self.save()
+        self._by_id[item.id] = item
+        self._by_guild.setdefault(item.guild_id, []).append(item)
+        self._append_log({"op": "add", "item": _item_dict(item, _TASK_FIELDS)})
         return item
 
     def remove(self, task_id: int) -> bool:
-        before = len(self._items)
-        self._items = [item for item in self._items if item.id != task_id]
-        if len(self._items) == before:
+        item = self._by_id.pop(task_id, None)
+        if item is None:
             return False
-        self.save()
+        self._items.remove(item)
+        self._by_guild[item.guild_id].remove(item)
+        self._append_log({"op": "remove", "id": task_id})
         return True
 
     def list_for_guild(self, guild_id: int) -> List[TaskItem]:
-        return [item for item in self._items if item.guild_id == guild_id]
+        return self._by_guild.get(guild_id, [])
+
+    def iter_sorted_for_guild(self, guild_id: int, limit: int = EMBED_MAX_FIELDS) -> List[TaskItem]:
+        bucket = self._by_guild.get(guild_id, ())
+        if len(bucket) <= limit:
+            return sorted(bucket, key=_task_sort_key)
+        # Top-K without sorting the whole bucket.
+        return heapq.nsmallest(limit, bucket, key=_task_sort_key)
 
 
 @dataclass
@@ -169,12 +424,12 @@ class GlossaryStore:
         if not self.path.exists():
             self._items = []
             return
-        data = json.loads(self.path.read_text())
+        data = _loads(self.path.read_bytes())
         self._items = [GlossaryItem(**item) for item in data.get("items", [])]
 
     def save(self) -> None:
         data = {"items": [item.__dict__ for item in self._items]}
-        self.path.write_text(json.dumps(data, indent=2))
+        _atomic_write_json(self.path, data)
 
     def add(self, guild_id: int, word: str, note: str) -> bool:
         if self.get(guild_id, word) is not None:
@@ -228,32 +483,49 @@ class GlossaryStore:
 
 
 class ConfigStore:
+    _DEFAULT_HOURLY: Dict[str, Optional[int]] = {"enabled": False, "channel_id": None}
+
     def __init__(self, path: Path) -> None:
         self.path = path
         self._data: Dict[str, Dict[str, Dict[str, Optional[int]]]] = {}
+        self._cache: Dict[int, Dict[str, Optional[int]]] = {}
+        self._hourly_enabled_guilds: set[int] = set()
         self.load()
 
     def load(self) -> None:
         if not self.path.exists():
             self._data = {"hourly_task_list": {}}
+            self._cache = {}
+            self._hourly_enabled_guilds = set()
             self.save()
             return
-        self._data = json.loads(self.path.read_text())
+        self._data = _loads(self.path.read_bytes())
         if "hourly_task_list" not in self._data:
             self._data["hourly_task_list"] = {}
+        # JSON keys are strings; keep an int-keyed mirror for the hot path.
+        self._cache = {int(k): v for k, v in self._data["hourly_task_list"].items()}
+        self._hourly_enabled_guilds = {
+            guild_id for guild_id, settings in self._cache.items() if settings.get("enabled")
+        }
 
     def save(self) -> None:
-        self.path.write_text(json.dumps(self._data, indent=2))
+        _atomic_write_json(self.path, self._data)
 
     def set_hourly_task_list(self, guild_id: int, enabled: bool, channel_id: Optional[int]) -> None:
-        self._data["hourly_task_list"][str(guild_id)] = {
-            "enabled": enabled,
-            "channel_id": channel_id,
-        }
+        settings = {"enabled": enabled, "channel_id": channel_id}
+        self._data["hourly_task_list"][str(guild_id)] = settings
+        self._cache[guild_id] = settings
+        if enabled:
+            self._hourly_enabled_guilds.add(guild_id)
+        else:
+            self._hourly_enabled_guilds.discard(guild_id)
         self.save()
 
     def get_hourly_task_list(self, guild_id: int) -> Dict[str, Optional[int]]:
-        return self._data.get("hourly_task_list", {}).get(str(guild_id), {"enabled": False, "channel_id": None})
+        return self._cache.get(guild_id, self._DEFAULT_HOURLY)
+
+    def hourly_enabled_guild_ids(self) -> set[int]:
+        return self._hourly_enabled_guilds
 
 
 class BotClient(discord.Client):
@@ -266,6 +538,11 @@ class BotClient(discord.Client):
         self.config = config
         self._scheduler_task: Optional[asyncio.Task] = None
         self._hourly_task: Optional[asyncio.Task] = None
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        self._fired_today: set[int] = set()
+        self._fired_today_date: Optional[date] = None
+        self._channel_cache: Dict[int, discord.abc.Messageable] = {}
+        self._channel_neg: Dict[int, float] = {}
 
     async def setup_hook(self) -> None:
         guild_id = os.getenv("DISCORD_GUILD_ID")
@@ -281,78 +558,143 @@ class BotClient(discord.Client):
             await self.tree.sync()
         self._scheduler_task = asyncio.create_task(self._schedule_loop())
         self._hourly_task = asyncio.create_task(self._hourly_loop())
+        self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
 
     async def _schedule_loop(self) -> None:
         await self.wait_until_ready()
         while not self.is_closed():
             await self._check_schedules()
-            await asyncio.sleep(CHECK_INTERVAL_SECONDS)
+            # Schedules have HH:MM granularity, so sleep to the next minute
+            # boundary instead of polling on a fixed interval.
+            now = datetime.now()
+            delay = 60 - now.second - now.microsecond / 1e6
+            await asyncio.sleep(max(0.5, delay))
 
     async def _hourly_loop(self) -> None:
         await self.wait_until_ready()
         while not self.is_closed():
+            # One wakeup per hour, at :00:00, instead of probing every 30 s.
+            now = datetime.now()
+            next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            await asyncio.sleep((next_hour - now).total_seconds())
             await self._check_hourly_task_list()
-            await asyncio.sleep(HOURLY_CHECK_SECONDS)
+
+    async def _checkpoint_loop(self) -> None:
+        # Journal appends keep mutations durable; this only folds them into
+        # a fresh snapshot every few minutes so replay stays short. A hard
+        # kill between checkpoints replays the journal on the next start.
+        await self.wait_until_ready()
+        while not self.is_closed():
+            await asyncio.sleep(60)
+            await self.store.flush_if_due(min_interval=CHECKPOINT_INTERVAL_SECONDS)
+            await self.tasks.flush_if_due(min_interval=CHECKPOINT_INTERVAL_SECONDS)
+
+    async def _resolve_channel(self, channel_id: int) -> Optional[discord.abc.Messageable]:
+        channel = self._channel_cache.get(channel_id)
+        if channel is not None:
+            return channel
+        missed_at = self._channel_neg.get(channel_id)
+        if missed_at is not None and time.monotonic() - missed_at < CHANNEL_NEGATIVE_TTL_SECONDS:
+            return None
+        channel = self.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await self.fetch_channel(channel_id)
+            except discord.NotFound:
+                # Remember the miss so a dead channel id does not cost an
+                # HTTP round-trip on every tick.
+                self._channel_neg[channel_id] = time.monotonic()
+                return None
+        self._channel_neg.pop(channel_id, None)
+        self._channel_cache[channel_id] = channel
+        return channel
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self._channel_cache.pop(channel.id, None)
+
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ) -> None:
+        self._channel_cache.pop(before.id, None)
+
+    async def close(self) -> None:
+        # Make sure debounced writes hit disk before the process exits.
+        self.store.flush()
+        self.tasks.flush()
+        await super().close()
 
     async def _check_schedules(self) -> None:
         now = datetime.now()
-        now_time = now.strftime("%H:%M")
+        # Pure integer formatting; strftime re-parses its format string on
+        # every call and this runs every tick forever.
+        now_time = f"{now.hour:02d}:{now.minute:02d}"
         today = now.date()
+        today_iso = today.isoformat()
 
-        for item in self.store.all():
-            if item.time != now_time:
+        if self._fired_today_date != today:
+            self._fired_today.clear()
+            self._fired_today_date = today
+
+        due = []
+        for item in self.store.due_at(now_time):
+            if item.id in self._fired_today:
                 continue
-            if item.last_run_date == today.isoformat():
+            if item.last_run_date == today_iso:
+                # Already fired before a restart; remember it in memory too.
+                self._fired_today.add(item.id)
                 continue
+            due.append(item)
 
-            try:
-                channel = self.get_channel(item.channel_id)
-                if channel is None:
-                    # Channel not found or bot not cached it yet
-                    channel = await self.fetch_channel(item.channel_id)
-                if isinstance(channel, discord.TextChannel):
-                    await channel.send(item.message)
-                    self.store.update_last_run(item.id, today)
-            except discord.DiscordException:
-                # Skip failures but keep the scheduler alive
-                continue
+        if not due:
+            return
+
+        async def _fire(item: ScheduleItem) -> None:
+            channel = await self._resolve_channel(item.channel_id)
+            if isinstance(channel, discord.TextChannel):
+                await channel.send(item.message)
+                self._fired_today.add(item.id)
+                self.store.update_last_run(item.id, today)
+
+        # Overlap the sends; failed ones are dropped just like the old
+        # per-item try/except, keeping the scheduler alive.
+        await asyncio.gather(*(_fire(item) for item in due), return_exceptions=True)
 
     async def _check_hourly_task_list(self) -> None:
-        now = datetime.now()
-        if now.minute != 0:
-            return
-        if now.second > 5:
+        enabled_ids = self.config.hourly_enabled_guild_ids()
+        if not enabled_ids:
             return
 
-        for guild in self.guilds:
-            settings = self.config.get_hourly_task_list(guild.id)
-            if not settings.get("enabled"):
-                continue
+        # Cap concurrency so a burst of broadcasts stays under Discord's
+        # per-route rate limits.
+        sem = asyncio.Semaphore(10)
+
+        async def _broadcast(guild: discord.Guild, settings: Dict[str, Optional[int]]) -> None:
+            async with sem:
+                channel_id = settings.get("channel_id")
+                channel: Optional[discord.abc.Messageable] = None
+                if channel_id:
+                    channel = await self._resolve_channel(channel_id)
+                else:
+                    channel = guild.system_channel
 
-            channel_id = settings.get("channel_id")
-            channel: Optional[discord.abc.Messageable] = None
-            if channel_id:
-                channel = self.get_channel(channel_id)
                 if channel is None:
-                    try:
-                        channel = await self.fetch_channel(channel_id)
-                    except discord.DiscordException:
-                        continue
-            else:
-                channel = guild.system_channel
-
-            if channel is None:
-                continue
+                    return
 
-            items = self.tasks.list_for_guild(guild.id)
-            if not items:
-                continue
+                items = self.tasks.iter_sorted_for_guild(guild.id)
+                if not items:
+                    return
 
-            embed = build_task_embed(items)
-            try:
-                await channel.send(embed=embed)
-            except discord.DiscordException:
+                await channel.send(embed=build_task_embed(items))
+
+        pending = []
+        for guild_id in enabled_ids:
+            guild = self.get_guild(guild_id)
+            if guild is None:
                 continue
+            pending.append(_broadcast(guild, self.config.get_hourly_task_list(guild_id)))
+        if pending:
+            # Failures are dropped per guild, as the old try/except did.
+            await asyncio.gather(*pending, return_exceptions=True)
 
 
 store = ScheduleStore(SCHEDULES_PATH)
@@ -361,6 +703,9 @@ config = ConfigStore(CONFIG_PATH)
 glossary = GlossaryStore(GLOSSARY_PATH)
 client = BotClient(store, tasks, config)
 
+atexit.register(store.flush)
+atexit.register(tasks.flush)
+
 
 @client.tree.command(name="ping", description="Check if the bot is alive")
 async def ping(interaction: discord.Interaction) -> None:
@@ -476,7 +821,7 @@ async def task_list(interaction: discord.Interaction) -> None:
         await interaction.response.send_message("No tasks found.")
         return
 
-    items = tasks.list_for_guild(interaction.guild.id)
+    items = tasks.iter_sorted_for_guild(interaction.guild.id)
     if not items:
         await interaction.response.send_message("No tasks found.")
         return
@@ -677,53 +1022,46 @@ async def sync_commands(interaction: discord.Interaction) -> None:
         await interaction.followup.send("Failed to sync commands.", ephemeral=True)
 
 
+_HHMM_MATCH = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$").match
+
+
 def _is_valid_time(value: str) -> bool:
-    try:
-        datetime.strptime(value, "%H:%M")
-        return True
-    except ValueError:
-        return False
+    return bool(_HHMM_MATCH(value))
 
 
 def _is_valid_date(value: str) -> bool:
     try:
-        datetime.strptime(value, "%Y-%m-%d")
+        date.fromisoformat(value)
         return True
     except ValueError:
         return False
 
 
-def build_task_embed(items: List[TaskItem]) -> discord.Embed:
-    urgency_rank = {"high": 0, "medium": 1, "low": 2}
+_URGENCY_RANK = {"high": 0, "medium": 1, "low": 2}
+_URGENCY_PREFIX = {"high": "🟥 ", "medium": "🟧 ", "low": "🟩 "}
 
-    def sort_key(item: TaskItem) -> tuple:
-        deadline_sort = item.deadline if item.deadline else "9999-12-31"
-        urgency_sort = urgency_rank.get((item.urgency or "").lower(), 3)
-        return (deadline_sort, urgency_sort, item.id)
 
-    items_sorted = sorted(items, key=sort_key)
+def _task_sort_key(item: TaskItem) -> tuple:
+    return (
+        item.deadline or "9999-12-31",
+        _URGENCY_RANK.get((item.urgency or "").lower(), 3),
+        item.id,
+    )
+
 
+def build_task_embed(items: Iterable[TaskItem]) -> discord.Embed:
+    # Expects items already in display order (see iter_sorted_for_guild);
+    # stops at Discord's per-embed field cap.
     embed = discord.Embed(title="Checklist", color=discord.Color.blurple())
-    for item in items_sorted:
-        details = []
-        urgency_prefix = ""
-        if item.urgency:
-            urgency_label = item.urgency.lower()
-            if urgency_label == "high":
-                urgency_prefix = "🟥 "
-            elif urgency_label == "medium":
-                urgency_prefix = "🟧 "
-            elif urgency_label == "low":
-                urgency_prefix = "🟩 "
-            else:
-                urgency_prefix = "⬜ "
+    for count, item in enumerate(items):
+        if count >= EMBED_MAX_FIELDS:
+            break
+        urgency = (item.urgency or "").lower()
+        urgency_prefix = _URGENCY_PREFIX.get(urgency, "⬜ " if item.urgency else "")
+        value = f"{urgency_prefix}{item.task}"
         if item.deadline:
-            details.append(f"Deadline: {item.deadline}")
-        embed.add_field(
-            name=f"#{item.id}",
-            value=f"{urgency_prefix}{item.task}" + ("\n" + "\n".join(details) if details else ""),
-            inline=False,
-        )
+            value += f"\nDeadline: {item.deadline}"
+        embed.add_field(name=f"#{item.id}", value=value, inline=False)
     return embed
 
 